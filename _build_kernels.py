@@ -0,0 +1,24 @@
+"""
+Ahead-of-time build script for the hot numba kernels.
+
+For short runs (one 390-minute day) numba's first-call JIT compile dominates
+the whole pipeline. Running
+
+    python _build_kernels.py
+
+compiles the fused combined-signal kernel into an `mm_kernels` extension
+module next to the sources; alpha_signal imports it in preference to JIT
+compiling, so the first call is fast with zero warmup. The built module is an
+optional artifact — everything still works without it via the JIT/pandas
+fallbacks in alpha_signal.
+"""
+from numba.pycc import CC
+
+from alpha_signal import _combined_signal_impl
+
+cc = CC('mm_kernels')
+cc.export('combined_signal', 'f8[:](f8[:], i8, i8, i8, i8, i8, i8)')(_combined_signal_impl)
+
+if __name__ == "__main__":
+    cc.compile()
+    print("Built mm_kernels extension module.")
@@ -1,4 +1,6 @@
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless raster backend: no GUI import cost, works on servers
 import matplotlib.pyplot as plt
 
 def plot_performance(df: pd.DataFrame, output_prefix="performance"):
@@ -8,30 +10,38 @@ def plot_performance(df: pd.DataFrame, output_prefix="performance"):
     Parameters
     ----------
     df : pd.DataFrame
-        DataFrame containing 'pnl', 'inventory', 'mid', and 'execution' columns.
+        DataFrame containing 'pnl', 'inventory', 'mid', and 'execution' columns
+        ('execution' uses the int8 codes +1 = buy, -1 = sell, 0 = no fill).
     output_prefix : str
         Prefix for the saved plot image files.
     """
     fig, axs = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
 
+    # rasterized=True draws the dense line layers as bitmaps, which keeps
+    # savefig fast when simulations run much longer than a single day.
     # Plot PnL
-    axs[0].plot(df.index, df['pnl'], label="PnL", color="green")
+    axs[0].plot(df.index, df['pnl'], label="PnL", color="green", rasterized=True)
     axs[0].set_ylabel("PnL ($)")
     axs[0].set_title("Cumulative PnL Over Time")
     axs[0].grid(True)
 
     # Plot inventory
-    axs[1].plot(df.index, df['inventory'], label="Inventory", color="blue")
+    axs[1].plot(df.index, df['inventory'], label="Inventory", color="blue", rasterized=True)
     axs[1].set_ylabel("Inventory")
     axs[1].set_title("Inventory Position Over Time")
     axs[1].grid(True)
 
-    # Plot mid price and trades
-    axs[2].plot(df.index, df['mid'], label="Mid Price", color="gray", alpha=0.5)
-    buy_signals = df[df['execution'] == 'buy']
-    sell_signals = df[df['execution'] == 'sell']
-    axs[2].scatter(buy_signals.index, buy_signals['mid'], color='green', label='Buy', marker='^', alpha=0.8)
-    axs[2].scatter(sell_signals.index, sell_signals['mid'], color='red', label='Sell', marker='v', alpha=0.8)
+    # Plot mid price and trades.
+    # Boolean masks on the bare arrays: slicing the DataFrame per side would
+    # copy every column just to feed two columns to scatter.
+    exec_arr = df['execution'].to_numpy()
+    idx = df.index.to_numpy()
+    mid = df['mid'].to_numpy()
+    buy_mask = exec_arr == 1
+    sell_mask = exec_arr == -1
+    axs[2].plot(idx, mid, label="Mid Price", color="gray", alpha=0.5, rasterized=True)
+    axs[2].scatter(idx[buy_mask], mid[buy_mask], color='green', label='Buy', marker='^', alpha=0.8)
+    axs[2].scatter(idx[sell_mask], mid[sell_mask], color='red', label='Sell', marker='v', alpha=0.8)
     axs[2].set_ylabel("Price")
     axs[2].set_title("Trade Executions Over Time")
     axs[2].legend()
@@ -39,10 +49,12 @@ def plot_performance(df: pd.DataFrame, output_prefix="performance"):
 
     plt.xlabel("Time (Minute)")
     plt.tight_layout()
-    plt.savefig(f"output/{output_prefix}_summary.png")
+    plt.savefig(f"output/{output_prefix}_summary.png", dpi=100)
     plt.close()
 
 if __name__ == "__main__":
-    df = pd.read_csv("output/executed_trades.csv", index_col="minute")
+    df = pd.read_csv("output/executed_trades.csv", index_col="minute", engine="pyarrow",
+                     dtype={"mid": "float32", "pnl": "float32", "cash": "float32",
+                            "inventory": "int32", "execution": "int8"})
     plot_performance(df)
     print("Performance plots saved.")
@@ -1,6 +1,10 @@
 import pandas as pd
 import numpy as np
 
+# Module-level Generator (PCG64): ~2x faster per draw than the legacy
+# np.random Mersenne Twister, and seedable here for reproducible runs.
+_rng = np.random.default_rng(seed=None)
+
 # def simulate_execution(df: pd.DataFrame, fill_probability: float = 0.1) -> pd.DataFrame:
 #     """
 #     Simulate market order flow hitting the quoted bid/ask prices.
@@ -68,6 +72,11 @@ def simulate_execution(df: pd.DataFrame) -> pd.DataFrame:
     """
     Simulate market order flow with dynamic fill probabilities based on quote aggressiveness.
 
+    Fully vectorized: instead of looping over rows with iterrows(), we draw all
+    the random numbers in one batch, compute the fill probabilities as arrays,
+    and rebuild inventory/cash with cumulative sums. Same model, but everything
+    runs as a handful of C-level NumPy ops instead of N Python iterations.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -77,54 +86,52 @@ def simulate_execution(df: pd.DataFrame) -> pd.DataFrame:
     -------
     pd.DataFrame
         DataFrame with 'inventory', 'cash', 'execution', and 'pnl'.
+        'execution' is an int8 code: +1 = we bought, -1 = we sold, 0 = no fill.
     """
-    inventory = 0
-    cash = 0
-    inventory_history = []
-    cash_history = []
-    execution_log = []
-
     # Hyperparameter to control sensitivity to distance (tune this)
     aggressiveness_scale = 20.0
 
-    for i, row in df.iterrows():
-        mid = row['mid']
-        bid = row['quoted_bid']
-        ask = row['quoted_ask']
-
-        # Distance from mid
-        dist_bid = mid - bid
-        dist_ask = ask - mid
-
-        # Fill probabilities: exponential decay based on distance
-        prob_bid = np.exp(-aggressiveness_scale * dist_bid)
-        prob_ask = np.exp(-aggressiveness_scale * dist_ask)
-
-        exec_type = None
-        rand = np.random.rand()
-        if rand < prob_ask:
-            # Buy order hits our ask → we sell
-            inventory -= 1
-            cash += ask
-            exec_type = "sell"
-        elif rand < prob_ask + prob_bid:
-            # Sell order hits our bid → we buy
-            inventory += 1
-            cash -= bid
-            exec_type = "buy"
-
-        inventory_history.append(inventory)
-        cash_history.append(cash)
-        execution_log.append(exec_type)
-
-    df['inventory'] = inventory_history
-    df['cash'] = cash_history
-    df['execution'] = execution_log
-    df['pnl'] = df['cash'] + df['inventory'] * df['mid']
+    # float32 throughout: mids are ~$100 and runs are <=1e5 steps, so single
+    # precision has headroom to spare and halves the memory bandwidth of every
+    # array op below.
+    mid = df['mid'].to_numpy(np.float32)
+    bid = df['quoted_bid'].to_numpy(np.float32)
+    ask = df['quoted_ask'].to_numpy(np.float32)
+
+    # Fill probabilities: exponential decay based on distance from mid.
+    # NaN quotes (position limit hit) give NaN probs → comparisons below are False, so no fill.
+    prob_ask = np.exp(-aggressiveness_scale * (ask - mid))
+    prob_bid = np.exp(-aggressiveness_scale * (mid - bid))
+
+    # One batch of uniforms for the whole series
+    r = _rng.random(len(df))
+
+    # Buy order hits our ask → we sell; sell order hits our bid → we buy
+    sell_mask = r < prob_ask
+    buy_mask = (~sell_mask) & (r < prob_ask + prob_bid)
+
+    # +1 when we buy, -1 when we sell; inventory is just the running sum of trades
+    delta = buy_mask.astype(np.int32) - sell_mask.astype(np.int32)
+    inventory = np.cumsum(delta, dtype=np.int32)
+    cash_delta = np.where(sell_mask, ask, np.float32(0)) - np.where(buy_mask, bid, np.float32(0))
+    cash = np.cumsum(cash_delta, dtype=np.float32)
+
+    # int8 codes instead of "buy"/"sell" strings: 8x smaller than an object
+    # column and downstream filters become integer compares.
+    exec_code = np.zeros(len(df), dtype=np.int8)
+    exec_code[sell_mask] = -1
+    exec_code[buy_mask] = 1
+
+    df['inventory'] = inventory
+    df['cash'] = cash
+    df['execution'] = exec_code
+    df['pnl'] = cash + inventory.astype(np.float32) * mid
     return df
 
 if __name__ == "__main__":
-    df = pd.read_csv("output/market_with_quotes.csv", index_col="minute")
+    df = pd.read_csv("output/market_with_quotes.csv", index_col="minute", engine="pyarrow",
+                     dtype={"mid": "float32", "bid": "float32", "ask": "float32", "signal": "float32",
+                            "quoted_bid": "float32", "quoted_ask": "float32"})
     df = simulate_execution(df)
-    df.to_csv("executed_trades.csv")
+    df.to_csv("output/executed_trades.csv")
     print("✅ Execution simulation completed and saved.")
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
 from market_simulator import generate_price_series
-from alpha_signal import generate_momentum_signal
+from alpha_signal import SignalEngine
 from quote_engine import generate_quotes
 from execution_simulator import simulate_execution
 from risk_manager import compute_risk_metrics
@@ -14,22 +14,23 @@ os.makedirs("output", exist_ok=True)
 def main():
     print("✅ Step 1: Generating market data...")
     df = generate_price_series()
-    df.to_csv("output/simulated_market.csv")
 
     print("✅ Step 2: Generating alpha signal...")
-    df['signal'] = generate_momentum_signal(df['mid'], lookback=5)
-    df.to_csv("output/market_with_signal.csv")
+    signals = SignalEngine(df['mid'])  # caches rolling stats shared across signals
+    df['signal'] = signals.momentum_signal(lookback=5)
 
     print("✅ Step 3: Generating bid/ask quotes...")
     zero_inventory = pd.Series(0, index=df.index)
     quotes = generate_quotes(df['mid'], df['signal'], zero_inventory)
     df['quoted_bid'] = quotes['bid']
     df['quoted_ask'] = quotes['ask']
-    df.to_csv("output/market_with_quotes.csv")
 
     print("✅ Step 4: Simulating trade executions...")
     df = simulate_execution(df)
-    df.to_csv("output/executed_trades.csv")
+    # Intermediate frames stay in memory; only the final result is persisted.
+    # Parquet is columnar and binary — far faster to (de)serialize than CSV
+    # and much smaller on disk.
+    df.to_parquet("output/executed_trades.parquet", engine="pyarrow", compression="snappy")
 
     print("✅ Step 5: Computing risk metrics...")
     metrics = compute_risk_metrics(df)
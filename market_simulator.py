@@ -1,6 +1,39 @@
 import numpy as np
 import pandas as pd
 
+# Module-level Generator (PCG64): ~2x faster per draw than the legacy
+# np.random Mersenne Twister, and seedable here for reproducible runs.
+_rng = np.random.default_rng(seed=None)
+
+def generate_price_paths(n_paths, n_minutes=390, initial_price=100.0, daily_vol=0.2):
+    """
+    Generate many independent price paths in one vectorized call.
+
+    For parameter sweeps / Monte Carlo, looping generate_price_series in Python
+    pays the NumPy dispatch overhead once per path. Drawing the whole
+    (n_paths, n_minutes) normal block at once and cumsum-ing along axis=1
+    amortizes that to a handful of array ops regardless of path count.
+
+    Parameters
+    ----------
+    n_paths : int
+        Number of independent paths to simulate.
+    n_minutes : int
+        Number of minutes per path (default 390, one trading day).
+    initial_price : float
+        Initial price of the asset.
+    daily_vol : float
+        Annualized daily volatility of returns.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_paths, n_minutes) of mid prices, one path per row.
+    """
+    minute_vol = daily_vol / (390 ** 0.5)
+    returns = _rng.standard_normal(size=(n_paths, n_minutes)) * minute_vol
+    return initial_price * np.exp(np.cumsum(returns, axis=1))
+
 def generate_price_series(n_minutes=390, initial_price=100.0, daily_vol=0.2, base_spread=0.05):
     """
     You get a sequence of simulated prices where:
@@ -24,9 +57,7 @@ def generate_price_series(n_minutes=390, initial_price=100.0, daily_vol=0.2, bas
     dataframe
         DataFrame with 'mid', 'bid', and 'ask' prices indexed by time.
     """
-    minute_vol = daily_vol / (390 ** 0.5)
-    returns = np.random.normal(loc=0, scale=minute_vol, size=n_minutes)
-    prices = initial_price * np.exp(np.cumsum(returns))
+    prices = generate_price_paths(1, n_minutes, initial_price, daily_vol)[0]
     bid_prices = prices - base_spread / 2
     ask_prices = prices + base_spread / 2
     df = pd.DataFrame({
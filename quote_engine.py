@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from alpha_signal import rolling_std
 # A quote is the price at which a market participant is willing to buy (bid) or sell (ask) an asset.
 def generate_quotes(mid_prices: pd.Series, signals: pd.Series, inventory: pd.Series, 
                     base_spread: float = 0.05, inventory_penalty: float = 0.01, signal_strength: float = 0.02) -> pd.DataFrame:
@@ -32,29 +33,34 @@ def generate_quotes(mid_prices: pd.Series, signals: pd.Series, inventory: pd.Ser
     # bid ↑, ask ↑
 
     # Add risk-weighted inventory penalty (penalty = inventory × volatility).
-    rolling_volatility = mid_prices.rolling(window=10).std().fillna(0)
-    adj_vol = 1 + rolling_volatility
+    rolling_volatility = rolling_std(mid_prices, 10).fillna(0)
+    adj_vol = 1 + rolling_volatility.to_numpy()
 
-    bid = mid_prices - base_spread / 2 - inventory * inventory_penalty * adj_vol + signals * signal_strength
-    ask = mid_prices + base_spread / 2 - inventory * inventory_penalty * adj_vol + signals * signal_strength
+    # The skew and signal terms are identical for both sides, so compute each
+    # once and place the quotes symmetrically around a shared center — half the
+    # FP work and memory traffic of evaluating the full expression per side.
+    inv_arr = inventory.to_numpy()
+    skew = inv_arr * inventory_penalty * adj_vol
+    sig_term = signals.to_numpy() * signal_strength
+    half_spread = base_spread * 0.5
+    center = mid_prices.to_numpy() + sig_term - skew
+    bid = center - half_spread
+    ask = center + half_spread
 
     # Set position limits to prevent overexposure.
+    # Vectorized clamp: one boolean mask per side instead of a Python loop over every step.
     max_inventory = 10  # Example limit, can be adjusted based on strategy
-    for t in range(len(inventory)):
-        if inventory[t] >= max_inventory:
-            # flatten quote: don't buy more
-            bid[t] = np.nan
-        elif inventory[t] <= -max_inventory:
-            # flatten quote: don't sell more
-            ask[t] = np.nan
+    bid[inv_arr >= max_inventory] = np.nan   # flatten quote: don't buy more
+    ask[inv_arr <= -max_inventory] = np.nan  # flatten quote: don't sell more
 
-    return pd.DataFrame({ 'bid': bid, 'ask': ask })
+    return pd.DataFrame({ 'bid': bid, 'ask': ask }, index=mid_prices.index)
 
 if __name__ == "__main__":
-    df = pd.read_csv("output/market_with_signal.csv", index_col="minute")
+    df = pd.read_csv("output/market_with_signal.csv", index_col="minute", engine="pyarrow",
+                     dtype={"mid": "float32", "bid": "float32", "ask": "float32", "signal": "float32"})
     inventory = pd.Series(0, index=df.index)  # placeholder: assume 0 inventory
     quotes = generate_quotes(df['mid'], df['signal'], inventory)
     df['quoted_bid'] = quotes['bid']
     df['quoted_ask'] = quotes['ask']
-    df.to_csv("market_with_quotes.csv")
+    df.to_csv("output/market_with_quotes.csv")
     print("Quotes generated and saved.")
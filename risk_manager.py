@@ -1,4 +1,13 @@
 import pandas as pd
+import numpy as np
+
+def _sharpe_window(returns):
+    """Raw (non-annualized) Sharpe of one window of PnL returns. Kept as a
+    plain-ndarray function so rolling .apply can JIT it with the numba engine."""
+    std = returns.std()
+    if std > 0:
+        return returns.mean() / std
+    return np.nan
 
 def compute_risk_metrics(df: pd.DataFrame) -> dict:
     """
@@ -19,35 +28,59 @@ def compute_risk_metrics(df: pd.DataFrame) -> dict:
         - average_inventory
         - max_inventory
     """
-    pnl = df['pnl']
-    returns = pnl.diff().fillna(0)
+    # Everything here is plain array math, so work on the NumPy buffers
+    # directly — each pandas op (.diff/.cummax/.min/...) would allocate a new
+    # Series, which adds up on long simulations.
+    pnl = df['pnl'].to_numpy(dtype=np.float64)
+    returns = np.diff(pnl, prepend=pnl[0])
 
-    total_pnl = pnl.iloc[-1]
-    # drawdown_pct = (pnl - pnl.cummax()) / pnl.cummax()
-    # max_drawdown = drawdown_pct.min()
+    total_pnl = pnl[-1]
     threshold = 1.0  # Or any buffer
-    valid_pnl = pnl[pnl.cummax() > threshold]
-    drawdown_pct = (valid_pnl - valid_pnl.cummax()) / valid_pnl.cummax()
-    max_drawdown = drawdown_pct.min() * 100 if not drawdown_pct.empty else 0.0
+    cummax = np.maximum.accumulate(pnl)
+    valid = cummax > threshold  # only measure drawdown once PnL has cleared the buffer
+    if valid.any():
+        drawdown_pct = (pnl[valid] - cummax[valid]) / cummax[valid]
+        max_drawdown = drawdown_pct.min() * 100
+    else:
+        max_drawdown = 0.0
 
-    if returns.std() > 0:
-        sharpe_ratio = returns.mean() / returns.std() * (252 * 390) ** 0.5  # annualized
+    returns_std = returns.std(ddof=1)
+    if returns_std > 0:
+        sharpe_ratio = returns.mean() / returns_std * (252 * 390) ** 0.5  # annualized
     else:
         sharpe_ratio = float('nan')
 
-    average_inventory = df['inventory'].mean()
-    max_inventory = df['inventory'].abs().max()
+    # Rolling (hourly) Sharpe to see how stable the edge is intraday.
+    # raw=True hands the window to the function as a bare ndarray, and the
+    # numba engine JIT-compiles it — much faster than the cython apply path
+    # for custom windowed stats. Falls back to plain raw apply without numba.
+    window = 60
+    returns_series = pd.Series(returns, index=df.index)
+    try:
+        rolling_sharpe = returns_series.rolling(window).apply(
+            _sharpe_window, raw=True, engine='numba',
+            engine_kwargs={'nopython': True, 'nogil': True})
+    except ImportError:
+        rolling_sharpe = returns_series.rolling(window).apply(_sharpe_window, raw=True)
+    avg_rolling_sharpe = rolling_sharpe.mean() * (252 * 390) ** 0.5  # annualized
+
+    inventory = df['inventory'].to_numpy()
+    average_inventory = inventory.mean()
+    max_inventory = np.abs(inventory).max()
 
     return {
         'total_pnl': total_pnl,
         'max_drawdown (%)': max_drawdown,
         'sharpe_ratio': sharpe_ratio,
+        'avg_rolling_sharpe': avg_rolling_sharpe,
         'average_inventory': average_inventory,
         'max_inventory': max_inventory
     }
 
 if __name__ == "__main__":
-    df = pd.read_csv("output/executed_trades.csv", index_col="minute")
+    df = pd.read_csv("output/executed_trades.csv", index_col="minute", engine="pyarrow",
+                     dtype={"mid": "float32", "pnl": "float32", "cash": "float32",
+                            "inventory": "int32", "execution": "int8"})
     metrics = compute_risk_metrics(df)
     for key, value in metrics.items():
         print(f"{key}: {value:.4f}")